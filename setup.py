@@ -15,6 +15,11 @@ setuptools.setup(
         "Operating System :: OS Independent",
     ],
     extras_require={
-        "dev": ["pre-commit==3.7.0", "pylint==3.1.0"],
+        "dev": [
+            "pre-commit==3.7.0",
+            "pylint==3.1.0",
+            "pytest==9.1.1",
+            "openpyxl==3.1.5",
+        ],
     },
 )
@@ -1,6 +1,7 @@
 import datetime
 import re
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 
 import pandas as pd
 import pdfplumber
@@ -13,22 +14,34 @@ from statement_parser.utils.regex_patterns import (
 )
 
 
-@dataclass
+@dataclass(frozen=True)
 class EndowusParser(AbstractParser):
     """
-    Parser for Endowus monthly statement
+    Parser for Endowus monthly statement. The parser is immutable, as goal and source
+    lookups are built once when it is created
 
     Args:
         file (str): file path with file name. The file should be in pdf format
         phrases (list[str]): list of phrases to identify pages
-        goals (list[str]): list of endowus goals
-        sources (list[str]): list of fund sources, e.g. "SGD Cash", "SRS", "CPF OA"
+        goals (Sequence[str]): endowus goals, stored as a tuple
+        sources (Sequence[str]): regex fragments matching fund sources, e.g.
+            "SGD Cash", "SRS", "CPF OA", stored as a tuple. They are joined into one
+            alternation, so the first source in the list wins when several match
     """
 
     file: str
     phrases: list[str]
-    goals: list[str]
-    sources: list[str]
+    goals: Sequence[str]
+    sources: Sequence[str]
+    _goal_set: frozenset[str] = field(init=False, repr=False)
+    _src_compile: re.Pattern = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # store inputs as tuples so the lookups built from them cannot go stale
+        object.__setattr__(self, "goals", tuple(self.goals))
+        object.__setattr__(self, "sources", tuple(self.sources))
+        object.__setattr__(self, "_goal_set", frozenset(self.goals))
+        object.__setattr__(self, "_src_compile", re.compile("|".join(self.sources)))
 
     def _extract_page(self) -> str:
         """Extract relevant pages based on phrases into a string
@@ -107,19 +120,17 @@ class EndowusParser(AbstractParser):
                 "create_date", "goal", "source",
                 "start_balance", "investment", "redemption", "gains_losses", "end_balance"
         """
-        src_compile = re.compile("|".join(self.sources))
-
         pages = self._extract_page()
         str_lst = pages.split("\n")
         final_dict: dict = {}
         for idx, line in enumerate(str_lst):
-            if line in self.goals:
+            if line in self._goal_set:
                 counter = 1
                 source = None
                 final_dict[line] = {}
                 while counter:
                     next_line = str_lst[idx + counter]
-                    src = src_compile.search(next_line)
+                    src = self._src_compile.search(next_line)
                     if src:
                         source = src.group()
                     elif "Total" in next_line:
@@ -0,0 +1,166 @@
+import datetime
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import pandas as pd
+
+from statement_parser.abstracts.parser import AbstractParser
+from statement_parser.fwd_parser import FwdParser
+from statement_parser.utils.constants import FWD_TRX_KEY_COL_NAMES
+from statement_parser.utils.page_cache import PageCache
+
+
+def _parse_statement(parser: FwdParser) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Run a single FWD parser. Kept at module level so it can be sent to worker processes
+
+    Args:
+        parser (FwdParser): parser of one FWD monthly statement
+
+    Returns:
+        pd.DataFrame: summary data of IUA and AUA accounts
+        pd.DataFrame: transaction data of IUA and AUA accounts
+    """
+    return parser.extract_data()
+
+
+@dataclass
+class FwdHistoryParser(AbstractParser):
+    """
+    Parser for a set of FWD monthly statements belonging to one policy
+
+    Statements only carry the product name (e.g. "FWD Invest First Plus"), so mixing
+    products is rejected, but statements of two policies of the same product cannot
+    be told apart. Callers must pass the statements of a single policy.
+
+    Args:
+        files (list[str]): file paths with file names. The files should be in pdf format
+        password (str): password to open the PDFs
+        max_workers (int | None): number of processes used to parse the statements,
+            capped at the number of files, defaults to the number of processors
+        page_cache (PageCache | None): cache of extracted pages shared by the workers
+    """
+
+    files: list[str]
+    password: str
+    max_workers: int | None = None
+    page_cache: PageCache | None = None
+
+    def _parse_statements(self) -> list[tuple[pd.DataFrame, pd.DataFrame]]:
+        """
+        Parse every statement in parallel and order them by valuation date
+
+        Returns:
+            list[tuple[pd.DataFrame, pd.DataFrame]]: summary and transaction data
+                of each statement, oldest statement first
+        """
+        if not self.files:
+            return []
+
+        parsers = [
+            FwdParser(file, self.password, self.page_cache) for file in self.files
+        ]
+        max_workers = min(len(parsers), self.max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_parse_statement, parsers))
+
+        return sorted(
+            results,
+            key=lambda result: (
+                datetime.date.min if result[0].empty else result[0]["create_date"].max()
+            ),
+        )
+
+    def _check_single_product(self, dfs: list[pd.DataFrame]):
+        """
+        Check that summary and transaction data all belong to one product
+
+        Args:
+            dfs (list[pd.DataFrame]): summary and transaction data of each statement
+
+        Raises:
+            ValueError: data belongs to more than one product
+        """
+        # policy_name holds the product name matched by FWD_POLICY_COMPILE
+        product_names = {
+            name
+            for df in dfs
+            if "policy_name" in df.columns
+            for name in df["policy_name"].dropna()
+        }
+        if len(product_names) > 1:
+            raise ValueError(
+                f"Statements belong to more than one product: {sorted(product_names)}"
+            )
+
+    def _merge_summary(self, summary_dfs: list[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Combine statement summaries into a month-end summary series
+
+        Args:
+            summary_dfs (list[pd.DataFrame]): summary data of each statement
+
+        Returns:
+            pd.DataFrame: one row per fund and report month, ordered by date
+        """
+        summary_dfs = [df for df in summary_dfs if not df.empty]
+        if not summary_dfs:
+            return pd.DataFrame()
+
+        summary_df = pd.concat(summary_dfs, ignore_index=True)
+        summary_df = summary_df.sort_values(
+            ["create_date", "fund_name"], kind="stable"
+        ).drop_duplicates(["report_month", "fund_name"], keep="last")
+
+        return summary_df.reset_index(drop=True)
+
+    def _merge_trx(self, trx_dfs: list[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Combine statement transactions, dropping rows already seen in an earlier statement
+
+        A transaction is identified by FWD_TRX_KEY_COL_NAMES. Identical rows within a
+        single statement are kept, as only the excess over earlier statements is new.
+
+        Args:
+            trx_dfs (list[pd.DataFrame]): transaction data of each statement, oldest first
+
+        Returns:
+            pd.DataFrame: transaction history ordered by create_date
+        """
+        seen: dict[tuple, int] = {}
+        new_trx_dfs = []
+        for trx_df in trx_dfs:
+            if trx_df.empty:
+                continue
+            counts: dict[tuple, int] = {}
+            keep = []
+            for key in zip(*(trx_df[col] for col in FWD_TRX_KEY_COL_NAMES)):
+                counts[key] = counts.get(key, 0) + 1
+                keep.append(counts[key] > seen.get(key, 0))
+            for key, count in counts.items():
+                seen[key] = max(seen.get(key, 0), count)
+            new_trx_dfs.append(trx_df[keep])
+
+        if not new_trx_dfs:
+            return pd.DataFrame()
+
+        trx_df = pd.concat(new_trx_dfs, ignore_index=True)
+        trx_df = trx_df.sort_values("create_date", kind="stable")
+
+        return trx_df.reset_index(drop=True)
+
+    def extract_data(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Extract summary series and transaction history from a policy's FWD statements
+
+        Returns:
+            pd.DataFrame: month-end summary data of IUA and AUA accounts
+            pd.DataFrame: de-duplicated transaction data of IUA and AUA accounts
+        """
+        results = self._parse_statements()
+        self._check_single_product([df for result in results for df in result])
+        summary_df = self._merge_summary([summary_df for summary_df, _ in results])
+        trx_df = self._merge_trx([trx_df for _, trx_df in results])
+
+        return summary_df, trx_df
@@ -7,6 +7,8 @@ import pandas as pd
 import pdfplumber
 
 from statement_parser.abstracts.parser import AbstractParser
+from statement_parser.utils.constants import FWD_PAGE_CACHE_VERSION
+from statement_parser.utils.page_cache import PageCache
 from statement_parser.utils.regex_patterns import (
     FWD_ABNORMAL_COMPILE,
     FWD_CLOSE_BAL_COMPILE,
@@ -28,10 +30,13 @@ class FwdParser(AbstractParser):
     Args:
         file (str): file path with file name. The file should be in pdf format
         password (str): password to open the PDF
+        page_cache (PageCache | None): cache of extracted pages, used to skip
+            decrypting the PDF again when the same statement is parsed repeatedly
     """
 
     file: str
     password: str
+    page_cache: PageCache | None = None
 
     def _extract_page(self) -> list[str]:
         """
@@ -40,6 +45,13 @@ class FwdParser(AbstractParser):
         Returns:
             list[str]: list of strings extracted from the PDF
         """
+        if self.page_cache is not None:
+            cached_pages = self.page_cache.get(
+                self.file, self.password, FWD_PAGE_CACHE_VERSION
+            )
+            if cached_pages is not None:
+                return cached_pages
+
         with pdfplumber.open(self.file, password=self.password) as pdf:
             all_pages = []
             for page in pdf.pages:
@@ -54,6 +66,15 @@ class FwdParser(AbstractParser):
                     text = text.replace(text[start_idx:end_idx], corrected_fund_name)
                 all_pages.append(text)
 
+        if self.page_cache is not None:
+            # a failed cache write should not fail the parse
+            try:
+                self.page_cache.put(
+                    self.file, self.password, FWD_PAGE_CACHE_VERSION, all_pages
+                )
+            except OSError:
+                pass
+
         return all_pages
 
     def _extract_trx_values(self, string: str) -> list[Any]:
@@ -21,3 +21,16 @@ IBKR_COL_NAMES = [
 
 # tickers to ignore due to (reverse) stock splits or m&a
 TICKERS_TO_IGNORE = ["APHA", "ACB", "CNTTQ", "HEXO", "IPOE", "UNG", "TELL"]
+
+# columns identifying the same fwd transaction across overlapping statements
+FWD_TRX_KEY_COL_NAMES = [
+    "fund_name",
+    "account_type",
+    "create_date",
+    "transaction_type",
+    "units",
+]
+
+# version of the pages cached by fwd_parser, bump whenever _extract_page or the fwd
+# regex patterns change so cached pages extracted by older code are not reused
+FWD_PAGE_CACHE_VERSION = "fwd-1"
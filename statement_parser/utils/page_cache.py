@@ -0,0 +1,191 @@
+import hashlib
+import json
+import os
+import shutil
+import stat
+import tempfile
+import time
+import weakref
+from dataclasses import dataclass, field
+
+# name of the directory created inside a caller supplied cache_dir
+PAGE_CACHE_DIR_NAME = "statement_parser_pages"
+
+# temp files older than this are left over from interrupted writes
+TMP_FILE_MAX_AGE_SEC = 3600
+
+
+def _remove_dir(path: str, owner_pid: int | None):
+    """
+    Remove a cache directory, only from the process that created it
+
+    Args:
+        path (str): cache directory
+        owner_pid (int | None): id of the process that created the directory
+    """
+    if owner_pid == os.getpid():
+        shutil.rmtree(path, ignore_errors=True)
+
+
+@dataclass
+class PageCache:
+    """
+    On-disk cache of pages extracted from (password-protected) PDF statements
+
+    Pages are stored as plain text in a directory only accessible by the current
+    user. Entries are keyed on the file path, size, modification time, password and
+    the version of the parser that extracted the pages, and the least recently used
+    entries are evicted once max_entries is exceeded. Unreadable entries are treated
+    as a miss and removed.
+
+    Args:
+        cache_dir (str | None): directory to create the cache directory in. If not
+            given, a temporary directory is created and removed on close() or
+            garbage collection
+        max_entries (int): maximum number of statements kept in the cache
+    """
+
+    cache_dir: str | None = None
+    max_entries: int = 128
+    _entry_dir: str = field(init=False, repr=False)
+    _owner_pid: int | None = field(init=False, default=None, repr=False)
+
+    def __post_init__(self):
+        if self.cache_dir is None:
+            self._entry_dir = tempfile.mkdtemp(prefix="statement_parser_")
+            self._owner_pid = os.getpid()
+            weakref.finalize(self, _remove_dir, self._entry_dir, self._owner_pid)
+            return
+
+        # keep entries in a dedicated directory so the caller's directory is untouched
+        self._entry_dir = os.path.join(self.cache_dir, PAGE_CACHE_DIR_NAME)
+        os.makedirs(self._entry_dir, mode=0o700, exist_ok=True)
+        if os.name == "posix":
+            dir_stat = os.stat(self._entry_dir)
+            if dir_stat.st_uid != os.getuid() or stat.S_IMODE(dir_stat.st_mode) & 0o077:
+                raise PermissionError(
+                    f"{self._entry_dir} must be owned by the current user "
+                    "and not accessible by others"
+                )
+
+    def __enter__(self) -> "PageCache":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _entry_path(self, file: str, password: str, version: str) -> str:
+        """
+        Build the cache file path of a statement
+
+        Args:
+            file (str): file path with file name of the statement
+            password (str): password to open the statement
+            version (str): version of the page extraction that produced the pages
+
+        Returns:
+            str: path of the cache entry
+        """
+        file_stat = os.stat(file)
+        raw_key = "|".join(
+            [
+                os.path.abspath(file),
+                str(file_stat.st_size),
+                str(file_stat.st_mtime_ns),
+                hashlib.sha256(password.encode()).hexdigest(),
+                version,
+            ]
+        )
+        key = hashlib.sha256(raw_key.encode()).hexdigest()
+        return os.path.join(self._entry_dir, f"{key}.json")
+
+    def _evict(self):
+        """Remove stale temp files and least recently used entries above max_entries"""
+        now = time.time()
+        entries = []
+        for entry in os.scandir(self._entry_dir):
+            # entries may be removed concurrently by other workers sharing the cache
+            try:
+                entry_stat = entry.stat()
+                if entry.name.endswith(".json"):
+                    entries.append((entry_stat.st_mtime_ns, entry.path))
+                elif (
+                    entry.name.endswith(".tmp")
+                    and now - entry_stat.st_mtime > TMP_FILE_MAX_AGE_SEC
+                ):
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                continue
+
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort()
+        for _, path in entries[: len(entries) - self.max_entries]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+
+    def get(self, file: str, password: str, version: str) -> list[str] | None:
+        """
+        Get cached pages of a statement
+
+        Args:
+            file (str): file path with file name of the statement
+            password (str): password to open the statement
+            version (str): version of the page extraction that produced the pages
+
+        Returns:
+            list[str] | None: cached pages, or None if the statement is not cached
+        """
+        path = self._entry_path(file, password, version)
+        try:
+            with open(path, encoding="utf-8") as f:
+                pages = json.load(f)
+            if not isinstance(pages, list):
+                raise ValueError(f"{path} does not hold a list of pages")
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # the cache is best effort, so an unreadable entry is dropped as a miss
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        # mark the entry as recently used for eviction
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+        return pages
+
+    def put(self, file: str, password: str, version: str, pages: list[str]):
+        """
+        Cache pages of a statement
+
+        Args:
+            file (str): file path with file name of the statement
+            password (str): password to open the statement
+            version (str): version of the page extraction that produced the pages
+            pages (list[str]): pages extracted from the statement
+        """
+        path = self._entry_path(file, password, version)
+        # mkstemp creates the file readable by the current user only
+        fd, tmp_path = tempfile.mkstemp(dir=self._entry_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(pages, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        self._evict()
+
+    def close(self):
+        """Remove the cache directory if it was created by this cache"""
+        _remove_dir(self._entry_dir, self._owner_pid)
@@ -0,0 +1,26 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from regression import REFERENCE_PAGES, load_pages, write_pdf
+
+
+@pytest.fixture(scope="session")
+def reference_pdf(tmp_path_factory) -> Path:
+    path = tmp_path_factory.mktemp("reference") / "reference.pdf"
+    write_pdf(path, REFERENCE_PAGES)
+    return path
+
+
+@pytest.fixture(scope="session")
+def statement_pdf(tmp_path_factory) -> Callable[[str, str], str]:
+    """Write a fixture statement into a pdf and return its path"""
+    pdf_dir = tmp_path_factory.mktemp("statements")
+
+    def write(fixture_name: str, file_name: str) -> str:
+        path = pdf_dir / file_name
+        if not path.exists():
+            write_pdf(path, load_pages(fixture_name))
+        return str(path)
+
+    return write
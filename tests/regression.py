@@ -0,0 +1,238 @@
+import json
+import os
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pdfplumber
+import pytest
+
+from statement_parser.abstracts.parser import AbstractParser
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+GOLDEN_DIR = Path(__file__).parent / "goldens"
+
+# set UPDATE_GOLDENS=1 to rewrite the goldens from the current parser output
+UPDATE_GOLDENS = os.environ.get("UPDATE_GOLDENS") == "1"
+
+
+# throughput budgets are timing dependent, so they only run when asked for
+throughput = pytest.mark.skipif(
+    os.environ.get("RUN_THROUGHPUT") != "1",
+    reason="set RUN_THROUGHPUT=1 to check throughput budgets",
+)
+
+# text of the reference statement timed next to each parser
+REFERENCE_PAGES = [
+    "\n".join(
+        f"Reference Item {chr(65 + i % 7)} {(page * 40 + i) * 1234.5:,.2f}"
+        for i in range(40)
+    )
+    for page in range(3)
+]
+REFERENCE_LINE_COMPILE = re.compile(r"Reference Item (\w) ([\d,]+\.\d{2})")
+
+
+@dataclass
+class ThroughputBudget:
+    """
+    Baseline parsing speed of a parser on its fixture statement, relative to a
+    reference workload timed on the same run, so budgets hold across machines
+
+    Args:
+        pages_per_reference (float | None): statement pages parsed in the time the
+            reference workload takes, None for parsers that do not read pages
+        rows_per_reference (float): output rows produced in the time the reference
+            workload takes
+        tolerance (float): fraction the measured speed may fall below the baseline
+    """
+
+    pages_per_reference: float | None
+    rows_per_reference: float
+    tolerance: float = 0.5
+
+
+def load_pages(name: str) -> list[str]:
+    """
+    Load anonymized page text of a fixture statement
+
+    Args:
+        name (str): fixture name without extension
+
+    Returns:
+        list[str]: text of each page
+    """
+    with open(FIXTURE_DIR / f"{name}.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_pdf(path: Path, pages: list[str]):
+    """
+    Write fixture page text into a minimal pdf, one text line per line of the page
+
+    pdfplumber extracts the text back unchanged, so parsers can run end to end on
+    fixtures without shipping binary statements.
+
+    Args:
+        path (Path): pdf file to write
+        pages (list[str]): text of each page
+    """
+
+    def escape(line: str) -> str:
+        return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for page_id, text in zip(page_ids, pages):
+        lines = " T* ".join(f"({escape(line)}) Tj" for line in text.split("\n"))
+        stream = f"BT /F1 9 Tf 12 TL 40 800 Td {lines} ET"
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+
+    pdf = "%PDF-1.4\n"
+    offsets = []
+    for obj_id, obj in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += f"{obj_id} 0 obj\n{obj}\nendobj\n"
+    xref_offset = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    pdf += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+    pdf += f"startxref\n{xref_offset}\n%%EOF\n"
+    path.write_text(pdf, encoding="latin-1")
+
+
+def _dtype_manifest(df: pd.DataFrame) -> dict[str, Any]:
+    """
+    Describe the dtypes of a dataframe, including python types in object columns
+
+    Args:
+        df (pd.DataFrame): dataframe to describe
+
+    Returns:
+        dict[str, Any]: index and column dtypes
+    """
+    columns = {}
+    for col in df.columns:
+        dtype = df[col].dtype
+        columns[str(col)] = {
+            "dtype": str(dtype),
+            "value_types": (
+                sorted({type(v).__name__ for v in df[col]}) if dtype == object else []
+            ),
+        }
+    return {"index": str(df.index.dtype), "columns": columns}
+
+
+def assert_matches_golden(df: pd.DataFrame, name: str):
+    """
+    Compare a dataframe with its golden csv and dtype manifest
+
+    Values are compared through the csv text, which writes floats with full
+    precision, so any change in value, row order or index fails the check.
+
+    Args:
+        df (pd.DataFrame): parser output
+        name (str): golden name without extension
+    """
+    csv_path = GOLDEN_DIR / f"{name}.csv"
+    dtypes_path = GOLDEN_DIR / f"{name}.dtypes.json"
+    csv = df.to_csv(lineterminator="\n")
+    manifest = _dtype_manifest(df)
+
+    if UPDATE_GOLDENS:
+        csv_path.write_text(csv, encoding="utf-8")
+        dtypes_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+    assert manifest == json.loads(dtypes_path.read_text(encoding="utf-8"))
+    assert csv == csv_path.read_text(encoding="utf-8")
+
+
+def _run_reference_workload(reference_pdf: Path):
+    """
+    Parse the reference statement with the same libraries the parsers use
+
+    Args:
+        reference_pdf (Path): pdf written from REFERENCE_PAGES
+    """
+    with pdfplumber.open(reference_pdf) as pdf:
+        lines = [line for page in pdf.pages for line in page.extract_text().split("\n")]
+    records = []
+    for line in lines:
+        match = REFERENCE_LINE_COMPILE.match(line)
+        if match:
+            records.append((match.group(1), float(match.group(2).replace(",", ""))))
+    df = pd.DataFrame.from_records(records, columns=["item", "value"])
+    df.groupby("item").agg(value=("value", "sum")).reset_index()
+
+
+def assert_within_budget(
+    parser: AbstractParser,
+    budget: ThroughputBudget,
+    pages: int,
+    reference_pdf: Path,
+    repeat: int = 5,
+    number: int = 5,
+):
+    """
+    Time a parser against the reference workload and check it against a budget
+
+    Parser and reference workload are timed alternately, so load on the machine
+    slows both, and the fastest of `repeat` timings of each is used.
+
+    Args:
+        parser (AbstractParser): parser set up with a fixture statement
+        budget (ThroughputBudget): baseline throughput of the parser
+        pages (int): number of pages in the fixture statement
+        reference_pdf (Path): pdf written from REFERENCE_PAGES
+        repeat (int): number of timings
+        number (int): number of calls in each timing
+    """
+    if repeat < 1 or number < 1:
+        raise ValueError("repeat and number must be at least 1")
+    # a page cache would turn every run after the first into a json read
+    if getattr(parser, "page_cache", None) is not None:
+        raise ValueError("Throughput must be measured without a page cache")
+
+    parser_timings = []
+    reference_timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            _run_reference_workload(reference_pdf)
+        reference_timings.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(number):
+            output = parser.extract_data()
+        parser_timings.append(time.perf_counter() - start)
+
+    relative_seconds = min(parser_timings) / min(reference_timings)
+    dfs = output if isinstance(output, tuple) else (output,)
+    measured = {
+        "pages_per_reference": pages / relative_seconds,
+        "rows_per_reference": sum(len(df) for df in dfs) / relative_seconds,
+    }
+    baseline = {
+        "pages_per_reference": budget.pages_per_reference,
+        "rows_per_reference": budget.rows_per_reference,
+    }
+    for metric, value in baseline.items():
+        if value is None:
+            continue
+        floor = value * (1 - budget.tolerance)
+        assert measured[metric] >= floor, (
+            f"{metric} {measured[metric]:.2f} is below {floor:.2f} "
+            f"(baseline {value:.2f}, tolerance {budget.tolerance:.0%})"
+        )
@@ -0,0 +1,34 @@
+import pytest
+from regression import (
+    ThroughputBudget,
+    assert_matches_golden,
+    assert_within_budget,
+    load_pages,
+    throughput,
+)
+
+from statement_parser.endowus_parser import EndowusParser
+
+PAGES = load_pages("endowus_pages")
+BUDGET = ThroughputBudget(pages_per_reference=7.0, rows_per_reference=14.0)
+
+
+@pytest.fixture
+def parser(statement_pdf):
+    return EndowusParser(
+        file=statement_pdf(
+            "endowus_pages", "Endowus_Statement_0000000_1 Oct 2024_to_31 Oct 2024.pdf"
+        ),
+        phrases=["Portfolio Summary"],
+        goals=["Retirement Goal", "Emergency Fund", "Education Goal"],
+        sources=["SGD Cash", "SRS", "CPF OA"],
+    )
+
+
+def test_extract_data_matches_golden(parser):
+    assert_matches_golden(parser.extract_data(), "endowus")
+
+
+@throughput
+def test_extract_data_throughput(parser, reference_pdf):
+    assert_within_budget(parser, BUDGET, len(PAGES), reference_pdf)
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+from regression import (
+    ThroughputBudget,
+    assert_matches_golden,
+    assert_within_budget,
+    load_pages,
+    throughput,
+    write_pdf,
+)
+
+from statement_parser.fwd_history_parser import FwdHistoryParser
+from statement_parser.utils.page_cache import PageCache
+
+FIXTURES = {
+    "fwd_2024_09.pdf": "fwd_pages_2024_09",
+    "fwd_2024_10.pdf": "fwd_pages_2024_10",
+}
+PAGES = sum(len(load_pages(name)) for name in FIXTURES.values())
+BUDGET = ThroughputBudget(pages_per_reference=4.8, rows_per_reference=10.5)
+
+
+@pytest.fixture
+def files(statement_pdf):
+    # files are passed newest first to check that statements are ordered by date
+    return [
+        statement_pdf(name, file)
+        for file, name in sorted(FIXTURES.items(), reverse=True)
+    ]
+
+
+@pytest.fixture
+def parser(files):
+    return FwdHistoryParser(files=files, password="password", max_workers=2)
+
+
+def test_extract_data_matches_golden(parser):
+    summary_df, trx_df = parser.extract_data()
+    assert_matches_golden(summary_df, "fwd_history_summary")
+    assert_matches_golden(trx_df, "fwd_history_trx")
+
+
+def test_extract_data_with_page_cache(files):
+    with PageCache() as page_cache:
+        parser = FwdHistoryParser(
+            files=files, password="password", max_workers=2, page_cache=page_cache
+        )
+        for _ in range(2):
+            summary_df, trx_df = parser.extract_data()
+            assert_matches_golden(summary_df, "fwd_history_summary")
+            assert_matches_golden(trx_df, "fwd_history_trx")
+        # workers get a pickled copy of the cache, which must not remove the directory
+        cache_entries = os.listdir(page_cache._entry_dir)
+        assert len(cache_entries) == len(files)
+
+
+def test_extract_data_rejects_multiple_products(tmp_path, files):
+    other_product = tmp_path / "fwd_2024_08.pdf"
+    write_pdf(
+        other_product,
+        [
+            page.replace("FWD Invest First Plus", "FWD Invest First Max")
+            for page in load_pages("fwd_pages_2024_09")
+        ],
+    )
+    parser = FwdHistoryParser(files=files + [str(other_product)], password="password")
+    with pytest.raises(ValueError, match="more than one product"):
+        parser.extract_data()
+
+
+def test_extract_data_without_files():
+    summary_df, trx_df = FwdHistoryParser(files=[], password="password").extract_data()
+    assert summary_df.empty and trx_df.empty
+
+
+@throughput
+def test_extract_data_throughput(parser, reference_pdf):
+    assert_within_budget(parser, BUDGET, PAGES, reference_pdf)
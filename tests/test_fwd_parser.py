@@ -0,0 +1,33 @@
+import pytest
+from regression import (
+    ThroughputBudget,
+    assert_matches_golden,
+    assert_within_budget,
+    load_pages,
+    throughput,
+)
+
+from statement_parser.fwd_parser import FwdParser
+
+PAGES = load_pages("fwd_pages_2024_10")
+BUDGET = ThroughputBudget(pages_per_reference=7.5, rows_per_reference=15.0)
+
+
+@pytest.fixture
+def parser(statement_pdf):
+    # the fixture has a fund name split over lines, "<fund> SGD\nAcc\n... SGD123"
+    return FwdParser(
+        file=statement_pdf("fwd_pages_2024_10", "fwd_2024_10.pdf"),
+        password="password",
+    )
+
+
+def test_extract_data_matches_golden(parser):
+    summary_df, trx_df = parser.extract_data()
+    assert_matches_golden(summary_df, "fwd_summary")
+    assert_matches_golden(trx_df, "fwd_trx")
+
+
+@throughput
+def test_extract_data_throughput(parser, reference_pdf):
+    assert_within_budget(parser, BUDGET, len(PAGES), reference_pdf)
@@ -0,0 +1,27 @@
+import pytest
+from regression import (
+    ThroughputBudget,
+    assert_matches_golden,
+    assert_within_budget,
+    load_pages,
+    throughput,
+)
+
+from statement_parser.ibkr_parser import IbkrParser
+
+PAGES = load_pages("ibkr_pages")
+BUDGET = ThroughputBudget(pages_per_reference=15.0, rows_per_reference=22.5)
+
+
+@pytest.fixture
+def parser(statement_pdf):
+    return IbkrParser(file=statement_pdf("ibkr_pages", "ibkr_2024_10.pdf"))
+
+
+def test_extract_data_matches_golden(parser):
+    assert_matches_golden(parser.extract_data(), "ibkr")
+
+
+@throughput
+def test_extract_data_throughput(parser, reference_pdf):
+    assert_within_budget(parser, BUDGET, len(PAGES), reference_pdf)
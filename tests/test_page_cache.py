@@ -0,0 +1,137 @@
+import os
+import pickle
+import stat
+
+import pdfplumber
+import pytest
+from regression import load_pages, write_pdf
+
+from statement_parser.fwd_parser import FwdParser
+from statement_parser.utils import page_cache as page_cache_module
+from statement_parser.utils.page_cache import PAGE_CACHE_DIR_NAME, PageCache
+
+
+def _mode(path) -> int:
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+@pytest.fixture
+def statement(tmp_path):
+    file = tmp_path / "statement.pdf"
+    file.write_text("statement")
+    return str(file)
+
+
+def test_entries_only_accessible_by_owner(tmp_path, statement):
+    os.chmod(tmp_path, 0o755)
+    page_cache = PageCache(cache_dir=str(tmp_path))
+    page_cache.put(statement, "password", "v1", ["page"])
+
+    entry_path = page_cache._entry_path(statement, "password", "v1")
+    assert _mode(tmp_path) == 0o755
+    assert _mode(tmp_path / PAGE_CACHE_DIR_NAME) == 0o700
+    assert _mode(entry_path) == 0o600
+
+
+def test_rejects_cache_dir_accessible_by_others(tmp_path):
+    (tmp_path / PAGE_CACHE_DIR_NAME).mkdir(mode=0o755)
+    os.chmod(tmp_path / PAGE_CACHE_DIR_NAME, 0o755)
+    with pytest.raises(PermissionError):
+        PageCache(cache_dir=str(tmp_path))
+
+
+def test_get_misses_on_other_password_or_version(tmp_path, statement):
+    page_cache = PageCache(cache_dir=str(tmp_path))
+    page_cache.put(statement, "password", "v1", ["page"])
+
+    assert page_cache.get(statement, "password", "v1") == ["page"]
+    assert page_cache.get(statement, "wrong", "v1") is None
+    assert page_cache.get(statement, "password", "v2") is None
+
+
+def test_unreadable_entry_is_a_miss(tmp_path, statement):
+    page_cache = PageCache(cache_dir=str(tmp_path))
+    entry_path = page_cache._entry_path(statement, "password", "v1")
+    with open(entry_path, "w", encoding="utf-8") as f:
+        f.write("{")
+
+    assert page_cache.get(statement, "password", "v1") is None
+    assert not os.path.exists(entry_path)
+
+
+def test_evicts_least_recently_used(tmp_path):
+    files = []
+    for name in ["a.pdf", "b.pdf", "c.pdf"]:
+        (tmp_path / name).write_text(name)
+        files.append(str(tmp_path / name))
+    page_cache = PageCache(cache_dir=str(tmp_path / "cache"), max_entries=2)
+    for mtime, file in enumerate(files[:2], 1):
+        page_cache.put(file, "password", "v1", [file])
+        os.utime(page_cache._entry_path(file, "password", "v1"), (mtime, mtime))
+
+    # reading a.pdf makes b.pdf the least recently used entry
+    page_cache.get(files[0], "password", "v1")
+    page_cache.put(files[2], "password", "v1", [files[2]])
+
+    assert page_cache.get(files[0], "password", "v1") == [files[0]]
+    assert page_cache.get(files[1], "password", "v1") is None
+    assert page_cache.get(files[2], "password", "v1") == [files[2]]
+
+
+def test_removes_stale_tmp_files(tmp_path, statement):
+    page_cache = PageCache(cache_dir=str(tmp_path))
+    entry_dir = tmp_path / PAGE_CACHE_DIR_NAME
+    (entry_dir / "stale.tmp").write_text("")
+    os.utime(entry_dir / "stale.tmp", (0, 0))
+    (entry_dir / "in_progress.tmp").write_text("")
+
+    page_cache.put(statement, "password", "v1", ["page"])
+
+    assert not (entry_dir / "stale.tmp").exists()
+    assert (entry_dir / "in_progress.tmp").exists()
+
+
+def test_close_removes_temp_dir_only_in_owner_process(monkeypatch):
+    page_cache = PageCache()
+    worker_copy = pickle.loads(pickle.dumps(page_cache))
+
+    with monkeypatch.context() as m:
+        m.setattr(page_cache_module.os, "getpid", lambda: -1)
+        worker_copy.close()
+    assert os.path.isdir(page_cache._entry_dir)
+
+    page_cache.close()
+    assert not os.path.exists(page_cache._entry_dir)
+
+
+def test_close_keeps_caller_cache_dir(tmp_path, statement):
+    page_cache = PageCache(cache_dir=str(tmp_path))
+    page_cache.put(statement, "password", "v1", ["page"])
+    page_cache.close()
+
+    assert page_cache.get(statement, "password", "v1") == ["page"]
+
+
+def test_fwd_parser_reuses_cached_pages(tmp_path, monkeypatch):
+    file = tmp_path / "fwd_2024_10.pdf"
+    write_pdf(file, load_pages("fwd_pages_2024_10"))
+    opened = []
+    pdfplumber_open = pdfplumber.open
+
+    def counting_open(*args, **kwargs):
+        opened.append(kwargs.get("password"))
+        return pdfplumber_open(*args, **kwargs)
+
+    monkeypatch.setattr("statement_parser.fwd_parser.pdfplumber.open", counting_open)
+
+    with PageCache() as page_cache:
+        parser = FwdParser(str(file), "password", page_cache)
+        uncached_pages = parser._extract_page()
+        assert parser._extract_page() == uncached_pages
+        assert opened == ["password"]
+
+        FwdParser(str(file), "wrong", page_cache)._extract_page()
+        assert opened == ["password", "wrong"]
+
+    # writing to a closed cache must not fail the parse
+    assert FwdParser(str(file), "other", page_cache)._extract_page() == uncached_pages
@@ -0,0 +1,60 @@
+import pandas as pd
+import pytest
+from regression import (
+    ThroughputBudget,
+    assert_matches_golden,
+    assert_within_budget,
+    throughput,
+)
+
+from statement_parser.saxo_parser import SaxoParser
+
+BUDGET = ThroughputBudget(pages_per_reference=None, rows_per_reference=33.0)
+
+
+@pytest.fixture
+def parser(tmp_path):
+    # synthetic trades covering ignored products, tickers and currencies
+    trades = pd.DataFrame(
+        {
+            "Trade Date": [
+                "01-Oct-2024 09:30:00",
+                "15-Oct-2024 14:05:10",
+                "16-Oct-2024 10:00:00",
+                "20-Oct-2024 11:11:11",
+                "28-Oct-2024 15:59:59",
+                "29-Oct-2024 09:45:00",
+            ],
+            "Product": ["Stock", "Etf", "Stock", "CfdOnStock", "Etn", "Stock"],
+            "Instrument Symbol": [
+                "AAPL:xnas",
+                "VOO:arcx",
+                "UNG:arcx",
+                "TSLA:xnas",
+                "XYZ:xnys",
+                "D05:xses",
+            ],
+            "Event": ["Buy", "Buy", "Buy", "Sell", "Sell", "Buy"],
+            "Quantity": [10, 2, 5, -3, -4, 100],
+            "Price": [
+                "170.50 USD",
+                "480.00 USD",
+                "15.25 USD",
+                "250.00 USD",
+                "12.40 USD",
+                "38.10 SGD",
+            ],
+        }
+    )
+    file = tmp_path / "saxo_2024_10.xlsx"
+    trades.to_excel(file, index=False)
+    return SaxoParser(file=str(file))
+
+
+def test_extract_data_matches_golden(parser):
+    assert_matches_golden(parser.extract_data(), "saxo")
+
+
+@throughput
+def test_extract_data_throughput(parser, reference_pdf):
+    assert_within_budget(parser, BUDGET, 0, reference_pdf)